@@ -4,21 +4,22 @@ from datetime import datetime
 
 # SQLite 데이터베이스 연결
 conn = sqlite3.connect('naver_kin.db')
+# DB 파일을 WAL 모드로 전환 (설정은 파일에 유지됨)
+conn.execute('PRAGMA journal_mode=WAL')
 cursor = conn.cursor()
 
 # 기존 테이블 삭제 (경고: 이 작업은 모든 데이터를 삭제합니다)
 cursor.execute('DROP TABLE IF EXISTS kin_data')
 
-# 테이블을 다시 생성
+# 테이블을 다시 생성 (url을 기본 키로 사용해 중복 확인과 upsert가 인덱스 탐색으로 처리되도록 함)
 cursor.execute('''CREATE TABLE kin_data (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    url TEXT PRIMARY KEY,
                     title TEXT,
-                    url TEXT,
                     date TEXT,
                     author TEXT,
                     views INTEGER,
                     created_at TEXT,
-                    question_detail TEXT,
+                    description TEXT,
                     tags TEXT,
                     scraped_at TEXT
-                )''')
+                ) WITHOUT ROWID''')
@@ -3,19 +3,15 @@ import asyncio
 import aiohttp
 from aiohttp import ClientSession
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException
-from selenium.common.exceptions import TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+import lxml.html
+import lxml.etree
+from lxml.cssselect import CSSSelector
 from datetime import datetime
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set, Optional
 import re
+import random
+from urllib.parse import urljoin
 
 
 # 로깅 설정
@@ -24,101 +20,121 @@ logger = logging.getLogger(__name__)
 
 # 상수 정의
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds
+RETRY_BASE_DELAY = 0.25  # seconds
+RETRY_MAX_DELAY = 10  # seconds
+RETRY_JITTER = 0.25  # seconds
+MAX_CONCURRENT_REQUESTS = 20
+BATCH_GET_LIMIT = 100  # BatchGetItem 요청당 최대 키 개수
+
+# 기본 요청 헤더 (헤더 없는 요청이 차단되는 것을 방지)
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36',
+    'Accept-Language': 'ko-KR,ko;q=0.9',
+}
+
+# 상세 페이지 파싱용 정규식과 셀렉터 (모듈 로드 시 한 번만 컴파일)
+_NUM_RE = re.compile(r'\d+')
+_TITLE_SELECTOR = CSSSelector('.endTitleSection')
+_USER_INFO_SELECTOR = CSSSelector('.userInfo__bullet')
+_INFO_ITEM_SELECTOR = CSSSelector('.infoItem')
+_DESCRIPTION_SELECTOR = CSSSelector('.questionDetail')
+_TAG_SELECTOR = CSSSelector('.tagList a')
 
 # DynamoDB 테이블 가져오기
 def get_dynamodb_table():
     dynamodb = boto3.resource('dynamodb')
     return dynamodb.Table('kin_data')
 
-# Chrome 드라이버 초기화 함수
-def initialize_webdriver():
-    logger.info("Initializing WebDriver...")
-    return webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+# 재시도 대기 시간 계산: 429 응답의 Retry-After를 우선하고, 그 외에는 지수 백오프 + 지터
+# Retry-After가 RETRY_MAX_DELAY를 넘으면 재시도를 포기하도록 None을 반환
+def get_retry_delay(attempt: int, error: Exception) -> Optional[float]:
+    if isinstance(error, aiohttp.ClientResponseError) and error.status == 429 and error.headers:
+        retry_after = error.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return float(retry_after) if float(retry_after) <= RETRY_MAX_DELAY else None
+    return min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY) + random.uniform(0, RETRY_JITTER)
 
 # 스크래핑된 타이틀에서 불필요한 공백과 줄바꿈 제거
 def clean_title(raw_title: str) -> str:
     return " ".join(raw_title.replace("질문", "").split()).strip()
 
-# 검색 결과 스크래핑 함수
-async def scrape_search_results(driver, search_url: str) -> List[Dict[str, Any]]:
+# 검색 결과 스크래핑 함수 (검색 결과 페이지는 정적 HTML이므로 WebDriver 없이 aiohttp로 가져옴)
+async def scrape_search_results(session: ClientSession, search_url: str) -> List[Dict[str, Any]]:
     logger.info(f"Accessing search results page: {search_url}")
-    driver.get(search_url)
 
-    # 페이지 로딩을 기다립니다.
-    try:
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'a._searchListTitleAnchor'))
-        )
-    except TimeoutException:
-        logger.error("Timed out waiting for page to load")
+    async def fetch_with_retry(url: str) -> str:
+        for attempt in range(MAX_RETRIES):
+            try:
+                async with session.get(url) as response:
+                    # 429/5xx는 재시도 대상이므로 예외로 전환
+                    if response.status == 429 or response.status >= 500:
+                        response.raise_for_status()
+                    # 네이버는 UTF-8로 응답하므로 charset 감지 없이 바로 디코딩
+                    raw = await response.read()
+                    return raw.decode('utf-8', errors='replace')
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Network error while fetching {url}: {e}. Retrying...")
+                if attempt < MAX_RETRIES - 1:
+                    delay = get_retry_delay(attempt, e)
+                    if delay is None:
+                        logger.error(f"Retry-After for {url} exceeds {RETRY_MAX_DELAY}s, giving up")
+                        return ""
+                    await asyncio.sleep(delay)
+        logger.error(f"Failed to fetch {url} after {MAX_RETRIES} attempts")
+        return ""
+
+    html = await fetch_with_retry(search_url)
+    if not html:
         return []
 
-    items = []
-    retries = 0
-    while retries < MAX_RETRIES:
-        try:
-            result_list = driver.find_element(By.CLASS_NAME, 'basic1')
-            items = result_list.find_elements(By.TAG_NAME, 'li')
-            logger.info(f"Found {len(items)} items in the search results.")
-            break
-        except (StaleElementReferenceException, NoSuchElementException) as e:
-            logger.warning(f"Error encountered while scraping search results: {e}. Retrying...")
-            retries += 1
-            if retries == MAX_RETRIES:
-                logger.error("Max retries reached. Unable to scrape search results.")
-                return []
-            time.sleep(RETRY_DELAY)
+    soup = BeautifulSoup(html, 'lxml')
+    items = soup.select('ul.basic1 li')
+    logger.info(f"Found {len(items)} items in the search results.")
 
     search_results = []
     for index, item in enumerate(items, start=1):
         try:
             # 타이틀을 추출하고 클린업 처리
-            title_element = item.find_element(By.CSS_SELECTOR, 'dt a._searchListTitleAnchor')
+            title_element = item.select_one('dt a._searchListTitleAnchor')
             raw_title = title_element.text
             title = clean_title(raw_title)
-            url = title_element.get_attribute('href')
-            date_element = item.find_element(By.CSS_SELECTOR, 'dd.txt_inline')
+            # WebDriver의 get_attribute('href')와 같이 절대 URL로 저장
+            url = urljoin(search_url, title_element['href'])
+            date_element = item.select_one('dd.txt_inline')
             date = date_element.text.strip()
 
             logger.info(f"Scraped item {index}: Title: {title}")
             search_results.append({"title": title, "url": url, "date": date})
-        except (StaleElementReferenceException, NoSuchElementException) as e:
+        except (AttributeError, TypeError) as e:
             logger.warning(f"Error scraping item {index}: {e}")
 
     return search_results
 
-# 상세 정보 스크래핑 함수
-async def scrape_detail_page(session: ClientSession, url: str) -> Dict[str, Any]:
-    async def fetch_with_retry(url: str) -> str:
-        for _ in range(MAX_RETRIES):
-            try:
-                async with session.get(url) as response:
-                    return await response.text()
-            except aiohttp.ClientError as e:
-                logger.warning(f"Network error while fetching {url}: {e}. Retrying...")
-                await asyncio.sleep(RETRY_DELAY)
-        logger.error(f"Failed to fetch {url} after {MAX_RETRIES} attempts")
-        return ""
-
-    html = await fetch_with_retry(url)
-    if not html:
-        return {}
-
-    soup = BeautifulSoup(html, 'html.parser')
+# 셀렉터에 일치하는 첫 번째 요소를 반환 (없으면 None)
+def select_first(selector: CSSSelector, tree):
+    found = selector(tree)
+    return found[0] if found else None
 
+# 상세 페이지 HTML 파싱 함수 (순수 CPU 작업)
+def parse_detail(html: str, url: str) -> Dict[str, Any]:
     try:
-        detail_title = soup.select_one('.endTitleSection').text.strip()
-        user_info = soup.select_one('.userInfo__bullet').text.strip()
+        tree = lxml.html.fromstring(html)
 
-        views_element = soup.select_one('.userInfo__bullet .infoItem:nth-of-type(2)')
-        created_at_element = soup.select_one('.userInfo__bullet .infoItem:nth-of-type(3)')
+        detail_title = select_first(_TITLE_SELECTOR, tree).text_content().strip()
+        user_info_element = select_first(_USER_INFO_SELECTOR, tree)
+        user_info = user_info_element.text_content().strip()
 
-        views = int(re.search(r'\d+', views_element.text).group()) if views_element else 0
-        created_at = created_at_element.text.replace("작성일", "").strip() if created_at_element else ""
+        # 조회수(두 번째)와 작성일(세 번째) 항목을 한 번의 탐색으로 가져옴
+        info_items = _INFO_ITEM_SELECTOR(user_info_element)
+        views_element = info_items[1] if len(info_items) > 1 else None
+        created_at_element = info_items[2] if len(info_items) > 2 else None
 
-        description = soup.select_one('.questionDetail').text.strip()
-        tags = ', '.join([tag.text for tag in soup.select('.tagList a')])
+        views = int(_NUM_RE.search(views_element.text_content()).group()) if views_element is not None else 0
+        created_at = created_at_element.text_content().replace("작성일", "").strip() if created_at_element is not None else ""
+
+        description = select_first(_DESCRIPTION_SELECTOR, tree).text_content().strip()
+        # 태그 안의 중첩 요소 텍스트까지 포함하도록 앵커별 text_content() 사용
+        tags = ', '.join(tag.text_content() for tag in _TAG_SELECTOR(tree))
 
         return {
             "title": detail_title,
@@ -129,71 +145,125 @@ async def scrape_detail_page(session: ClientSession, url: str) -> Dict[str, Any]
             "tags": tags,
             "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
-    except AttributeError as e:
+    except (AttributeError, ValueError, lxml.etree.ParserError) as e:
         logger.error(f"Error parsing detail page {url}: {e}")
         return {}
 
-def save_to_dynamodb(table, data: Dict[str, Any]):
+# 상세 정보 스크래핑 함수
+async def scrape_detail_page(session: ClientSession, semaphore: asyncio.Semaphore, url: str) -> Dict[str, Any]:
+    async def fetch_with_retry(url: str) -> str:
+        for attempt in range(MAX_RETRIES):
+            try:
+                # 동시 요청 수를 제한해 서버 차단과 소켓 폭증을 방지
+                async with semaphore, session.get(url) as response:
+                    # 429/5xx는 재시도 대상이므로 예외로 전환
+                    if response.status == 429 or response.status >= 500:
+                        response.raise_for_status()
+                    # 네이버는 UTF-8로 응답하므로 charset 감지 없이 바로 디코딩
+                    raw = await response.read()
+                    return raw.decode('utf-8', errors='replace')
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Network error while fetching {url}: {e}. Retrying...")
+                if attempt < MAX_RETRIES - 1:
+                    delay = get_retry_delay(attempt, e)
+                    if delay is None:
+                        logger.error(f"Retry-After for {url} exceeds {RETRY_MAX_DELAY}s, giving up")
+                        return ""
+                    await asyncio.sleep(delay)
+        logger.error(f"Failed to fetch {url} after {MAX_RETRIES} attempts")
+        return ""
+
+    html = await fetch_with_retry(url)
+    if not html:
+        return {}
+
+    # 파싱은 CPU 작업이므로 스레드 풀에서 실행해 다른 요청의 진행을 막지 않음
+    return await asyncio.to_thread(parse_detail, html, url)
+
+def save_to_dynamodb(table, data_list: List[Dict[str, Any]]):
     try:
-        logger.info(f"Saving to DynamoDB: {data['title']}")
-        table.put_item(Item={
-            'url': data['url'],
-            'date': data['date'],
-            'title': data['title'],
-            'author': data.get('author'),
-            'views': data.get('views'),
-            'created_at': data.get('created_at'),
-            'description': data.get('description'),
-            'tags': data.get('tags'),
-            'scraped_at': data.get('scraped_at')
-        })
+        # batch_writer가 최대 25개씩 BatchWriteItem으로 묶고 미처리 항목은 자동 재시도
+        with table.batch_writer(overwrite_by_pkeys=['url', 'date']) as batch:
+            for data in data_list:
+                batch.put_item(Item={
+                    'url': data['url'],
+                    'date': data['date'],
+                    'title': data['title'],
+                    'author': data.get('author'),
+                    'views': data.get('views'),
+                    'created_at': data.get('created_at'),
+                    'description': data.get('description'),
+                    'tags': data.get('tags'),
+                    'scraped_at': data.get('scraped_at')
+                })
+        logger.info(f"Saved {len(data_list)} items to DynamoDB")
     except Exception as e:
         logger.error(f"Error saving to DynamoDB: {e}")
 
-def url_exists(table, url: str) -> bool:
+def get_existing_urls(table, search_results: List[Dict[str, Any]]) -> Set[str]:
+    # URL마다 GetItem을 보내는 대신 BatchGetItem으로 (url, date) 키를 한꺼번에 조회
+    keys = [
+        {'url': {'S': url}, 'date': {'S': date}}
+        for url, date in {(result['url'], result['date']) for result in search_results}
+    ]
+    existing_urls = set()
     try:
-        response = table.get_item(
-            Key={
-                'url': url,
-                'date': 'some_date'  # Sort Key가 있다면 필요
+        for i in range(0, len(keys), BATCH_GET_LIMIT):
+            request_items = {
+                table.name: {
+                    'Keys': keys[i:i + BATCH_GET_LIMIT],
+                    'ProjectionExpression': '#url',
+                    'ExpressionAttributeNames': {'#url': 'url'}
+                }
             }
-        )
-        return 'Item' in response
+            while request_items:
+                response = table.meta.client.batch_get_item(RequestItems=request_items)
+                existing_urls.update(item['url']['S'] for item in response['Responses'].get(table.name, []))
+                request_items = response.get('UnprocessedKeys')
     except Exception as e:
         logger.error(f"Error checking URL existence in DynamoDB: {e}")
-        return False
+    return existing_urls
 
 async def main():
     table = get_dynamodb_table()
-    driver = initialize_webdriver()
 
     try:
         search_url = "https://kin.naver.com/search/list.naver?query=%ED%95%80%EB%8B%A4&section=qna&period=1w&dirId=4&sort=date"
-        search_results = await scrape_search_results(driver, search_url)
 
-        async with aiohttp.ClientSession() as session:
+        # keep-alive 연결 재사용과 DNS 캐시로 요청당 핸드셰이크 비용 제거
+        connector = aiohttp.TCPConnector(limit=50, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=15)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=REQUEST_HEADERS) as session:
+            search_results = await scrape_search_results(session, search_url)
+
+            existing_urls = get_existing_urls(table, search_results)
+
+            pending = []
             tasks = []
             for result in search_results:
-                if not url_exists(table, result['url']):
-                    tasks.append(scrape_detail_page(session, result['url']))
+                if result['url'] not in existing_urls:
+                    pending.append(result)
+                    tasks.append(scrape_detail_page(session, semaphore, result['url']))
                 else:
                     logger.info(f"URL already exists in DynamoDB, skipping: {result['url']}")
 
             details = await asyncio.gather(*tasks)
 
-        for result, detail in zip(search_results, details):
+        data_list = []
+        for result, detail in zip(pending, details):
             if detail:
                 detail.pop('title', None)
-                data = {**result, **detail}
-                save_to_dynamodb(table, data)
-                logger.info(f"Saved data for URL: {result['url']}")
+                result.update(detail)
+                data_list.append(result)
             else:
                 logger.warning(f"Failed to scrape details for URL: {result['url']}")
 
+        save_to_dynamodb(table, data_list)
+
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}")
-    finally:
-        driver.quit()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -3,9 +3,13 @@ import asyncio
 import aiohttp
 from aiohttp import ClientSession
 from bs4 import BeautifulSoup
+import lxml.html
+import lxml.etree
+from lxml.cssselect import CSSSelector
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set, Optional
 import re
+import random
 from datetime import datetime
 
 # 로깅 설정
@@ -14,11 +18,45 @@ logger = logging.getLogger(__name__)
 
 # 상수 정의
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds
+RETRY_BASE_DELAY = 0.25  # seconds
+RETRY_MAX_DELAY = 10  # seconds
+RETRY_JITTER = 0.25  # seconds
+MAX_CONCURRENT_REQUESTS = 20
+
+# 상세 페이지 파싱용 정규식과 셀렉터 (모듈 로드 시 한 번만 컴파일)
+_NUM_RE = re.compile(r'\d+')
+_TITLE_SELECTOR = CSSSelector('.endTitleSection')
+_USER_INFO_SELECTOR = CSSSelector('.userInfo__bullet')
+_INFO_ITEM_SELECTOR = CSSSelector('.infoItem')
+_DESCRIPTION_SELECTOR = CSSSelector('.questionDetail')
+_TAG_SELECTOR = CSSSelector('.tagList a')
 
 # SQLite 데이터베이스 연결 함수
 def get_db_connection():
-    return sqlite3.connect('naver_kin.db')
+    # 트랜잭션을 BEGIN IMMEDIATE/COMMIT으로 직접 제어하기 위해 autocommit 모드로 연결
+    conn = sqlite3.connect('naver_kin.db', isolation_level=None, check_same_thread=False)
+    # WAL + NORMAL 동기화로 커밋당 fsync 횟수를 줄임
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA cache_size=-20000')
+    conn.execute('PRAGMA mmap_size=268435456')
+    return conn
+
+# 읽기 전용 SQLite 연결 함수 (WAL 모드에서 쓰기 연결과 경합 없이 조회)
+def get_read_connection():
+    conn = sqlite3.connect('naver_kin.db', check_same_thread=False)
+    conn.execute('PRAGMA query_only=1')
+    return conn
+
+# 재시도 대기 시간 계산: 429 응답의 Retry-After를 우선하고, 그 외에는 지수 백오프 + 지터
+# Retry-After가 RETRY_MAX_DELAY를 넘으면 재시도를 포기하도록 None을 반환
+def get_retry_delay(attempt: int, error: Exception) -> Optional[float]:
+    if isinstance(error, aiohttp.ClientResponseError) and error.status == 429 and error.headers:
+        retry_after = error.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return float(retry_after) if float(retry_after) <= RETRY_MAX_DELAY else None
+    return min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY) + random.uniform(0, RETRY_JITTER)
 
 # 스크래핑된 타이틀에서 불필요한 공백과 줄바꿈 제거
 def clean_title(raw_title: str) -> str:
@@ -29,13 +67,23 @@ async def scrape_search_results(session: ClientSession, search_url: str) -> List
     logger.info(f"Accessing search results page: {search_url}")
 
     async def fetch_with_retry(url: str) -> str:
-        for _ in range(MAX_RETRIES):
+        for attempt in range(MAX_RETRIES):
             try:
                 async with session.get(url) as response:
-                    return await response.text()
-            except aiohttp.ClientError as e:
+                    # 429/5xx는 재시도 대상이므로 예외로 전환
+                    if response.status == 429 or response.status >= 500:
+                        response.raise_for_status()
+                    # 네이버는 UTF-8로 응답하므로 charset 감지 없이 바로 디코딩
+                    raw = await response.read()
+                    return raw.decode('utf-8', errors='replace')
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 logger.warning(f"Network error while fetching {url}: {e}. Retrying...")
-                await asyncio.sleep(RETRY_DELAY)
+                if attempt < MAX_RETRIES - 1:
+                    delay = get_retry_delay(attempt, e)
+                    if delay is None:
+                        logger.error(f"Retry-After for {url} exceeds {RETRY_MAX_DELAY}s, giving up")
+                        return ""
+                    await asyncio.sleep(delay)
         logger.error(f"Failed to fetch {url} after {MAX_RETRIES} attempts")
         return ""
 
@@ -43,7 +91,7 @@ async def scrape_search_results(session: ClientSession, search_url: str) -> List
     if not html:
         return []
 
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, 'lxml')
     items = soup.select('ul.basic1 li')
     logger.info(f"Found {len(items)} items in the search results.")
 
@@ -64,37 +112,31 @@ async def scrape_search_results(session: ClientSession, search_url: str) -> List
 
     return search_results
 
-# 상세 정보 스크래핑 함수
-async def scrape_detail_page(session: ClientSession, url: str) -> Dict[str, Any]:
-    async def fetch_with_retry(url: str) -> str:
-        for _ in range(MAX_RETRIES):
-            try:
-                async with session.get(url) as response:
-                    return await response.text()
-            except aiohttp.ClientError as e:
-                logger.warning(f"Network error while fetching {url}: {e}. Retrying...")
-                await asyncio.sleep(RETRY_DELAY)
-        logger.error(f"Failed to fetch {url} after {MAX_RETRIES} attempts")
-        return ""
-
-    html = await fetch_with_retry(url)
-    if not html:
-        return {}
-
-    soup = BeautifulSoup(html, 'html.parser')
+# 셀렉터에 일치하는 첫 번째 요소를 반환 (없으면 None)
+def select_first(selector: CSSSelector, tree):
+    found = selector(tree)
+    return found[0] if found else None
 
+# 상세 페이지 HTML 파싱 함수 (순수 CPU 작업)
+def parse_detail(html: str, url: str) -> Dict[str, Any]:
     try:
-        detail_title = soup.select_one('.endTitleSection').text.strip()
-        user_info = soup.select_one('.userInfo__bullet').text.strip()
+        tree = lxml.html.fromstring(html)
 
-        views_element = soup.select_one('.userInfo__bullet .infoItem:nth-of-type(2)')
-        created_at_element = soup.select_one('.userInfo__bullet .infoItem:nth-of-type(3)')
+        detail_title = select_first(_TITLE_SELECTOR, tree).text_content().strip()
+        user_info_element = select_first(_USER_INFO_SELECTOR, tree)
+        user_info = user_info_element.text_content().strip()
 
-        views = int(re.search(r'\d+', views_element.text).group()) if views_element else 0
-        created_at = created_at_element.text.replace("작성일", "").strip() if created_at_element else ""
+        # 조회수(두 번째)와 작성일(세 번째) 항목을 한 번의 탐색으로 가져옴
+        info_items = _INFO_ITEM_SELECTOR(user_info_element)
+        views_element = info_items[1] if len(info_items) > 1 else None
+        created_at_element = info_items[2] if len(info_items) > 2 else None
 
-        description = soup.select_one('.questionDetail').text.strip()
-        tags = ', '.join([tag.text for tag in soup.select('.tagList a')])
+        views = int(_NUM_RE.search(views_element.text_content()).group()) if views_element is not None else 0
+        created_at = created_at_element.text_content().replace("작성일", "").strip() if created_at_element is not None else ""
+
+        description = select_first(_DESCRIPTION_SELECTOR, tree).text_content().strip()
+        # 태그 안의 중첩 요소 텍스트까지 포함하도록 앵커별 text_content() 사용
+        tags = ', '.join(tag.text_content() for tag in _TAG_SELECTOR(tree))
 
         return {
             "title": detail_title,
@@ -105,69 +147,118 @@ async def scrape_detail_page(session: ClientSession, url: str) -> Dict[str, Any]
             "tags": tags,
             "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
-    except AttributeError as e:
+    except (AttributeError, ValueError, lxml.etree.ParserError) as e:
         logger.error(f"Error parsing detail page {url}: {e}")
         return {}
 
-def save_to_database(conn: sqlite3.Connection, data: Dict[str, Any]):
-    cursor = conn.cursor()
+# 상세 정보 스크래핑 함수
+async def scrape_detail_page(session: ClientSession, semaphore: asyncio.Semaphore, url: str) -> Dict[str, Any]:
+    async def fetch_with_retry(url: str) -> str:
+        for attempt in range(MAX_RETRIES):
+            try:
+                # 동시 요청 수를 제한해 서버 차단과 소켓 폭증을 방지
+                async with semaphore, session.get(url) as response:
+                    # 429/5xx는 재시도 대상이므로 예외로 전환
+                    if response.status == 429 or response.status >= 500:
+                        response.raise_for_status()
+                    # 네이버는 UTF-8로 응답하므로 charset 감지 없이 바로 디코딩
+                    raw = await response.read()
+                    return raw.decode('utf-8', errors='replace')
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Network error while fetching {url}: {e}. Retrying...")
+                if attempt < MAX_RETRIES - 1:
+                    delay = get_retry_delay(attempt, e)
+                    if delay is None:
+                        logger.error(f"Retry-After for {url} exceeds {RETRY_MAX_DELAY}s, giving up")
+                        return ""
+                    await asyncio.sleep(delay)
+        logger.error(f"Failed to fetch {url} after {MAX_RETRIES} attempts")
+        return ""
+
+    html = await fetch_with_retry(url)
+    if not html:
+        return {}
+
+    # 파싱은 CPU 작업이므로 스레드 풀에서 실행해 다른 요청의 진행을 막지 않음
+    return await asyncio.to_thread(parse_detail, html, url)
+
+def save_to_database(cursor: sqlite3.Cursor, data_list: List[Dict[str, Any]]):
+    rows = [
+        (
+            data['title'], data['url'], data['date'],
+            data.get('author'), data.get('views'), data.get('created_at'),
+            data.get('description'), data.get('tags'), data.get('scraped_at')
+        )
+        for data in data_list
+    ]
     try:
-        # 중복 URL 확인 로직 추가
-        cursor.execute("SELECT 1 FROM kin_data WHERE url = ?", (data['url'],))
-        if cursor.fetchone():
-            logger.info(f"URL already exists in DB, skipping: {data['url']}")
-            return
-
-        logger.info(f"Saving to DB: {data['title']}")
-        cursor.execute('''
+        # 모든 행을 하나의 트랜잭션으로 묶어 커밋(fsync)을 한 번만 수행
+        cursor.execute('BEGIN IMMEDIATE')
+        cursor.executemany('''
             INSERT OR REPLACE INTO kin_data 
             (title, url, date, author, views, created_at, description, tags, scraped_at) 
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            data['title'], data['url'], data['date'],
-            data.get('author'), data.get('views'), data.get('created_at'),
-            data.get('description'), data.get('tags'), data.get('scraped_at')
-        ))
-        conn.commit()
+        ''', rows)
+        cursor.execute('COMMIT')
+        logger.info(f"Saved {len(rows)} rows to DB")
     except sqlite3.Error as e:
         logger.error(f"Database error: {e}")
-        conn.rollback()
+        if cursor.connection.in_transaction:
+            cursor.execute('ROLLBACK')
 
-def url_exists(conn: sqlite3.Connection, url: str) -> bool:
-    cursor = conn.cursor()
-    cursor.execute("SELECT 1 FROM kin_data WHERE url = ?", (url,))
-    return cursor.fetchone() is not None
+def get_existing_urls(conn: sqlite3.Connection, urls: List[str]) -> Set[str]:
+    # URL마다 SELECT를 보내는 대신 한 번의 IN 쿼리로 이미 저장된 URL을 조회
+    if not urls:
+        return set()
+    placeholders = ', '.join('?' * len(urls))
+    cursor = conn.execute(f"SELECT url FROM kin_data WHERE url IN ({placeholders})", urls)
+    return {row[0] for row in cursor}
 
 async def main():
     conn = get_db_connection()
+    read_conn = get_read_connection()
+    # 쓰기용 커서는 한 번만 만들어 재사용
+    write_cursor = conn.cursor()
 
     try:
         search_url = "https://kin.naver.com/search/list.naver?query=%ED%95%80%EB%8B%A4&section=qna&period=1w&dirId=4&sort=date"
 
-        async with aiohttp.ClientSession() as session:
+        # keep-alive 연결 재사용과 DNS 캐시로 요청당 핸드셰이크 비용 제거
+        connector = aiohttp.TCPConnector(limit=50, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=15)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
             search_results = await scrape_search_results(session, search_url)
 
+            existing_urls = get_existing_urls(read_conn, [result['url'] for result in search_results])
+
+            pending = []
             tasks = []
             for result in search_results:
-                if not url_exists(conn, result['url']):
-                    tasks.append(scrape_detail_page(session, result['url']))
+                if result['url'] not in existing_urls:
+                    pending.append(result)
+                    tasks.append(scrape_detail_page(session, semaphore, result['url']))
                 else:
                     logger.info(f"URL already exists in DB, skipping: {result['url']}")
 
             details = await asyncio.gather(*tasks)
 
-        for result, detail in zip(search_results, details):
+        data_list = []
+        for result, detail in zip(pending, details):
             if detail:
                 detail.pop('title', None)
-                data = {**result, **detail}
-                save_to_database(conn, data)
-                logger.info(f"Saved data for URL: {result['url']}")
+                result.update(detail)
+                data_list.append(result)
             else:
                 logger.warning(f"Failed to scrape details for URL: {result['url']}")
 
+        save_to_database(write_cursor, data_list)
+
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}")
     finally:
+        read_conn.close()
         conn.close()
 
 if __name__ == "__main__":
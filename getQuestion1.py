@@ -1,5 +1,6 @@
 import json
-import urllib.request
+import urllib.parse
+import urllib3
 import os
 import re
 import boto3
@@ -12,20 +13,25 @@ client_secret = os.environ['NAVER_CLIENT_SECRET']
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table('NaverKinQuestions')
 
+# 웜 스타트 간에 연결을 재사용하도록 모듈 레벨에서 커넥션 풀 생성
+http = urllib3.PoolManager(num_pools=1, maxsize=4)
+
+_HTML_RE = re.compile('<.*?>')
+
 
 def clean_html(raw_html):
-    cleanr = re.compile('<.*?>')
-    cleantext = re.sub(cleanr, '', raw_html)
-    return cleantext
+    return _HTML_RE.sub('', raw_html)
+
+
+def parse_date(date_string):
+    return datetime.strptime(date_string, "%a, %d %b %Y %H:%M:%S +0900")
 
 
-def format_date(date_string):
-    date_obj = datetime.strptime(date_string, "%a, %d %b %Y %H:%M:%S +0900")
+def format_date(date_obj):
     return date_obj.strftime("%Y년 %m월 %d일 %p %I시 %M분 %S초").replace("AM", "오전").replace("PM", "오후")
 
 
-def get_timestamp(date_string):
-    date_obj = datetime.strptime(date_string, "%a, %d %b %Y %H:%M:%S +0900")
+def get_timestamp(date_obj):
     return int(date_obj.timestamp())
 
 
@@ -41,35 +47,39 @@ def lambda_handler(event, context):
     encText = urllib.parse.quote("핀다")
     url = f"https://openapi.naver.com/v1/search/kin?query={encText}&display=3&sort=date&adult=1"
 
-    request = urllib.request.Request(url)
-    request.add_header("X-Naver-Client-Id", client_id)
-    request.add_header("X-Naver-Client-Secret", client_secret)
+    headers = {
+        "X-Naver-Client-Id": client_id,
+        "X-Naver-Client-Secret": client_secret
+    }
 
     try:
-        response = urllib.request.urlopen(request)
-        rescode = response.getcode()
+        response = http.request('GET', url, headers=headers, timeout=5.0)
+        rescode = response.status
         if rescode == 200:
-            response_body = response.read()
-            search_result = json.loads(response_body.decode('utf-8'))
+            search_result = json.loads(response.data.decode('utf-8'))
 
-            last_build_date = search_result.get('lastBuildDate', '')
+            last_build_date = parse_date(search_result.get('lastBuildDate', ''))
             formatted_date = format_date(last_build_date)
             timestamp = get_timestamp(last_build_date)
 
-            for item in search_result['items']:
-                unique_id = extract_id_from_url(item.get('link', ''))
-                table.put_item(
-                    Item={
-                        'id': unique_id,
-                        'url': item.get('link', ''),
-                        'last_build_date': formatted_date,
-                        'timestamp': timestamp,
-                        'title': clean_html(item.get('title', '')),
-                        'description': clean_html(item.get('description', '')),
-                        'proceed': False,
-                        'is_related': None
-                    }
-                )
+            records = [
+                {
+                    'id': extract_id_from_url(item.get('link', '')),
+                    'url': item.get('link', ''),
+                    'last_build_date': formatted_date,
+                    'timestamp': timestamp,
+                    'title': clean_html(item.get('title', '')),
+                    'description': clean_html(item.get('description', '')),
+                    'proceed': False,
+                    'is_related': None
+                }
+                for item in search_result['items']
+            ]
+
+            # 항목별 PutItem 대신 BatchWriteItem(최대 25개)으로 묶어서 저장
+            with table.batch_writer(overwrite_by_pkeys=['id']) as batch:
+                for record in records:
+                    batch.put_item(Item=record)
 
             return {
                 'statusCode': 200,